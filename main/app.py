@@ -7,34 +7,52 @@ using GraphRAG with a clean, object-oriented design pattern.
 import sys
 import os
 import uuid
-import json
+import logging
 import datetime
-import boto3
+import time
 import asyncio
+import numpy as np
 import concurrent.futures
+from collections import defaultdict
+from contextlib import asynccontextmanager, AsyncExitStack
 from typing import Optional, Dict, List, Union
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from enum import Enum
+import aiofiles
+import aioboto3
+from botocore.config import Config
 
 # Add the project root directory to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import settings to configure environment variables first
 from src import settings
-from src.generators import QuestionGeneratorFactory
-from src.utils.constants import metadata_keys, content_tenant_mapping
-from src.utils.summary_helper import generate_content_summary_sync
+from src.generators import BaseQuestionGenerator, QuestionGeneratorFactory
+from src.utils.constants import AVAILABLE_KEYS, content_tenant_mapping
+from src.utils.helpers import dump_questions_json
+from src.utils.summary_helper import generate_content_summary
 
-# Initialize DynamoDB client
-dynamodb = boto3.resource(
-    'dynamodb',
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO'))
+logger = logging.getLogger(__name__)
+
+# Shared AWS session; the DynamoDB resource itself is opened in the app lifespan
+aws_session = aioboto3.Session(
     region_name=os.environ.get('AWS_REGION', 'us-east-1'),
     aws_access_key_id=os.environ.get('AWS_ACCESS_KEY_ID'),
     aws_secret_access_key=os.environ.get('AWS_SECRET_ACCESS_KEY')
 )
 
+# Connection pool, keep-alive, timeouts and retries for DynamoDB
+dynamodb_config = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    connect_timeout=5,
+    read_timeout=10,
+    tcp_keepalive=True
+)
+
 # Get the DynamoDB tables
 table_names = {
     'history': 'question_generation_history',
@@ -42,22 +60,38 @@ table_names = {
     'events': 'events'
 }
 
-tables = {}
-try:
-    for key, table_name in table_names.items():
-        tables[key] = dynamodb.Table(table_name)
-        # Test if table exists by performing a small operation
-        tables[key].scan(Limit=1)
-        print(f"Successfully connected to DynamoDB table: {table_name}")
-except Exception as e:
-    print(f"Warning: DynamoDB table access error - {str(e)}")
-    print("Will log to console instead of DynamoDB")
-    tables = {key: None for key in table_names.keys()}
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the DynamoDB resource on startup and release shared resources on shutdown."""
+    async with AsyncExitStack() as stack:
+        tables = {}
+        try:
+            dynamodb = await stack.enter_async_context(
+                aws_session.resource('dynamodb', config=dynamodb_config)
+            )
+            # describe_table is a metadata call and consumes no read capacity; probe all tables concurrently
+            await asyncio.gather(*[
+                dynamodb.meta.client.describe_table(TableName=table_name)
+                for table_name in table_names.values()
+            ])
+            for key, table_name in table_names.items():
+                tables[key] = await dynamodb.Table(table_name)
+                logger.info("Successfully connected to DynamoDB table: %s", table_name)
+        except Exception as e:
+            logger.warning("DynamoDB table access error - %s", e)
+            logger.warning("Will log to console instead of DynamoDB")
+            tables = {key: None for key in table_names.keys()}
+        app.state.tables = tables
+        
+        yield
+    
+    question_service.shutdown()
 
 app = FastAPI(
     title="Question Generation API - Refactored",
     description="Refactored API for generating different types of questions using GraphRAG with class-based modular architecture",
-    version="3.0.0"
+    version="3.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -107,117 +141,155 @@ class QuestionResponse(BaseModel):
     blooms_taxonomy_distribution: Dict[str, float]  
     files_generated: list
     data: dict
+    timings: Optional[Dict[str, float]] = None
 
 class QuestionGenerationService:
     """
     Service class that orchestrates question generation using the generator classes.
     """
     
-    def __init__(self):
-        self.available_keys = list(set(metadata_keys.keys()))
+    def __init__(self, max_workers: int = 8):
+        # Dedicated, reused pool so generator threads stay warm across requests
+        # and total generator concurrency is capped regardless of request rate
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="qgen"
+        )
+        # Summaries live in the generators' shared cache; these locks are keyed the same way
+        self._summary_locks = defaultdict(asyncio.Lock)
+        # Coroutines holding or waiting on each summary lock, so a lock is only dropped once unused
+        self._summary_lock_users = defaultdict(int)
     
-    def calculate_question_distribution(self, total_questions: int, question_type_dist: Dict[str, float], 
-                                      difficulty_dist: Dict[str, float], blooms_dist: Dict[str, float]):
-        """Calculate the exact number of questions for each combination of question type, difficulty, and bloom's level"""
-        # First, calculate exact fractional counts for all combinations
-        fractional_distribution = {}
+    def shutdown(self):
+        """Release the generator thread pool, waiting for in-flight work to finish."""
+        self._executor.shutdown(wait=True)
+    
+    async def get_content_summary(self, tenant_id: str, chapter_id: str,
+                                  learning_objectives: Optional[Union[str, List[str]]]) -> str:
+        """
+        Return the content summary for a chapter, reusing a cached one when available.
+        
+        A per-key lock ensures concurrent requests for the same cold key
+        trigger only one summary generation.
+        """
+        content_summary = BaseQuestionGenerator.get_cached_summary(tenant_id, chapter_id, learning_objectives)
+        if content_summary is not None:
+            logger.info("Using cached content summary for chapter: %s", chapter_id)
+            return content_summary
         
-        for q_type, q_ratio in question_type_dist.items():
-            for difficulty, d_ratio in difficulty_dist.items():
-                for blooms, b_ratio in blooms_dist.items():
-                    exact_count = total_questions * q_ratio * d_ratio * b_ratio
-                    key = f"{q_type}_{difficulty}_{blooms}"
-                    fractional_distribution[key] = {
-                        'question_type': q_type,
-                        'difficulty': difficulty,
-                        'blooms_level': blooms,
-                        'exact_count': exact_count,
-                        'count': int(exact_count)  # Floor value
-                    }
+        key = BaseQuestionGenerator.summary_cache_key(tenant_id, chapter_id, learning_objectives)
+        self._summary_lock_users[key] += 1
+        try:
+            async with self._summary_locks[key]:
+                content_summary = BaseQuestionGenerator.get_cached_summary(tenant_id, chapter_id, learning_objectives)
+                if content_summary is None:
+                    # Summary generation waits on GraphRAG/Bedrock network calls rather than
+                    # CPU, so running it off the event loop keeps other requests responsive
+                    content_summary = await generate_content_summary(
+                        tenant_id=tenant_id,
+                        chapter_id=chapter_id,
+                        learning_objectives=learning_objectives,
+                        all_keys=AVAILABLE_KEYS
+                    )
+                    BaseQuestionGenerator.cache_summary(tenant_id, chapter_id, learning_objectives, content_summary)
+        finally:
+            # Drop the lock only when no coroutine holds or waits on it, including after a failure
+            self._summary_lock_users[key] -= 1
+            if not self._summary_lock_users[key]:
+                del self._summary_lock_users[key]
+                self._summary_locks.pop(key, None)
         
-        # Calculate remainder needed to reach total_questions
-        current_total = sum([item['count'] for item in fractional_distribution.values()])
-        remainder = total_questions - current_total
+        return content_summary
+    
+    def calculate_question_distribution(self, total_questions: int, question_type_dist: Dict[str, float], 
+                                      difficulty_dist: Dict[str, float], blooms_dist: Dict[str, float]) -> Dict[str, Dict]:
+        """
+        Calculate the exact number of questions for each combination of question type, difficulty, and bloom's level.
         
-        # Sort by fractional part (descending) to allocate remainder
-        sorted_keys = sorted(
-            fractional_distribution.keys(),
-            key=lambda k: fractional_distribution[k]['exact_count'] - fractional_distribution[k]['count'],
-            reverse=True
+        Returns:
+            Dictionary mapping each question type to its total count, normalized difficulty/blooms
+            distributions and its (difficulty, blooms_level, count) configs
+        """
+        q_types = list(question_type_dist.keys())
+        difficulties = list(difficulty_dist.keys())
+        blooms_levels = list(blooms_dist.keys())
+        
+        # Exact fractional counts for all combinations as a single outer product
+        exact = np.einsum(
+            'i,j,k->ijk',
+            total_questions * np.fromiter(question_type_dist.values(), dtype=float, count=len(q_types)),
+            np.fromiter(difficulty_dist.values(), dtype=float, count=len(difficulties)),
+            np.fromiter(blooms_dist.values(), dtype=float, count=len(blooms_levels))
         )
+        # Truncate toward zero like int(), so negative ratios round the same way as before
+        counts = np.trunc(exact).astype(int)
         
-        # Distribute remainder to items with highest fractional parts
-        for i in range(remainder):
-            if i < len(sorted_keys):
-                fractional_distribution[sorted_keys[i]]['count'] += 1
+        # Distribute the remainder to the combinations with the highest fractional parts
+        remainder = max(total_questions - int(counts.sum()), 0)
+        flat_counts = counts.ravel()
+        top_indices = np.argsort(-(exact - counts).ravel(), kind='stable')[:remainder]
+        flat_counts[top_indices] += 1
         
-        # Remove items with zero count and clean up the structure
-        distribution = {}
-        for key, item in fractional_distribution.items():
-            if item['count'] > 0:
-                distribution[key] = {
-                    'question_type': item['question_type'],
-                    'difficulty': item['difficulty'],
-                    'blooms_level': item['blooms_level'],
-                    'count': item['count']
+        # Keep only combinations with a positive count, grouping them by question type as we go
+        positive = counts > 0
+        type_totals = np.where(positive, counts, 0).sum(axis=(1, 2))
+        per_type = {}
+        for i, j, k in zip(*np.nonzero(positive)):
+            q_type, difficulty, blooms = q_types[i], difficulties[j], blooms_levels[k]
+            count = int(counts[i, j, k])
+            
+            if q_type not in per_type:
+                per_type[q_type] = {
+                    'total': int(type_totals[i]),
+                    'difficulty_dist': {},
+                    'blooms_dist': {},
+                    'configs': []
                 }
+            type_spec = per_type[q_type]
+            share = count / type_spec['total']
+            type_spec['difficulty_dist'][difficulty] = type_spec['difficulty_dist'].get(difficulty, 0) + share
+            type_spec['blooms_dist'][blooms] = type_spec['blooms_dist'].get(blooms, 0) + share
+            type_spec['configs'].append((difficulty, blooms, count))
         
-        return distribution
+        return per_type
     
-    async def generate_single_question_type_async(self, question_type: str, configs: list, content_summary: str, 
-                                                 tenant_id: str, chapter_id: str, learning_objectives: Optional[Union[str, List[str]]],
-                                                 difficulty_distribution: Dict[str, float], 
-                                                 blooms_distribution: Dict[str, float]) -> tuple:
+    async def generate_single_question_type_async(self, question_type: str, type_spec: Dict, content_summary: str, 
+                                                 tenant_id: str, chapter_id: str,
+                                                 learning_objectives: Optional[Union[str, List[str]]]) -> tuple:
         """Async wrapper for generating a single question type using the generator classes."""
+        total_for_type = type_spec['total']
         
-        def generate_sync():
-            try:
-                # Aggregate counts for this question type
-                total_for_type = sum([config['count'] for config in configs])
-                
-                print(f"[THREAD] Generating {question_type} questions (count: {total_for_type})...")
-                
-                # Create the appropriate generator using the factory
-                generator = QuestionGeneratorFactory.create_generator(question_type, tenant_id)
-                
-                # Generate questions using the generator
-                response_text = generator.generate(
+        def _call_generator():
+            logger.info("[THREAD] Generating %s questions (count: %d)...", question_type, total_for_type)
+            
+            # Borrow a warm generator for the tenant and question type
+            with QuestionGeneratorFactory.borrow_generator(question_type, tenant_id) as generator:
+                # Only the generator call runs on the worker thread; the file is written asynchronously below
+                return generator.generate(
                     chapter_id=chapter_id,
                     learning_objectives=learning_objectives,
                     num_questions=total_for_type,
-                    difficulty_distribution=difficulty_distribution,
-                    blooms_taxonomy_distribution=blooms_distribution,
-                    content_summary=content_summary
+                    difficulty_distribution=type_spec['difficulty_dist'],
+                    blooms_taxonomy_distribution=type_spec['blooms_dist'],
+                    content_summary=content_summary,
+                    save_to_file=False
                 )
-                
-                # Generate filename exactly as the generator does
-                difficulty_str = "_".join([f"{diff}{int(prop*100)}" for diff, prop in difficulty_distribution.items()])
-                blooms_str = "_".join([f"{bloom}{int(prop*100)}" for bloom, prop in blooms_distribution.items()])
-                
-                filename_parts = [chapter_id, difficulty_str, blooms_str]
-                if learning_objectives and self.available_keys and 'learning_objectives' in self.available_keys:
-                    obj_str = "lo" + ("_".join([str(obj) for obj in learning_objectives]) if isinstance(learning_objectives, list) else str(learning_objectives))
-                    filename_parts.append(obj_str)
-                
-                file_name = "_".join(filename_parts) + f"_{question_type}.json"
-                
-                # Read the generated JSON file
-                with open(file_name, 'r') as json_file:
-                    question_data = json.load(json_file)
-                
-                print(f"[THREAD] Completed generating {question_type} questions")
-                return question_type, file_name, question_data, None
-                
-            except Exception as e:
-                import traceback
-                error_details = traceback.format_exc()
-                print(f"[THREAD] Error generating {question_type} questions: {str(e)}")
-                print(f"[THREAD] Full error details: {error_details}")
-                return question_type, None, None, str(e)
         
-        # Run the sync function in a thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, generate_sync)
+        try:
+            # Run the generator in the service's dedicated thread pool
+            loop = asyncio.get_running_loop()
+            question_data, file_name = await loop.run_in_executor(self._executor, _call_generator)
+            
+            # Persist the questions without tying up a worker thread during disk I/O
+            async with aiofiles.open(file_name, 'wb') as json_file:
+                await json_file.write(dump_questions_json(question_data))
+            
+            logger.info("[THREAD] Completed generating %s questions", question_type)
+            return question_type, file_name, question_data, None
+            
+        except Exception as e:
+            logger.exception("[THREAD] Error generating %s questions: %s", question_type, e)
+            return question_type, None, None, str(e)
 
 # Initialize the service
 question_service = QuestionGenerationService()
@@ -251,7 +323,7 @@ async def generate_questions(sourceId: str, request: QuestionRequest, req: Reque
     4. Maintained parallel processing capabilities
     5. All original functionality preserved
     """
-    # Generate timestamp for the request
+    # Wall-clock timestamp for the request log; elapsed times use the monotonic clock
     request_timestamp = datetime.datetime.utcnow().isoformat()
     status = "success"
     error_message = ""
@@ -262,93 +334,60 @@ async def generate_questions(sourceId: str, request: QuestionRequest, req: Reque
     session_id = request.session_id if request.session_id else generate_session_id()
     tenant_id = content_tenant_mapping.get(request.contentId)
     
-    print(f"Processing REFACTORED request for sourceId: {sourceId}")
-    print(f"Request parameters: {request.dict()}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Processing REFACTORED request sourceId=%s params=%s", sourceId, request.model_dump_json())
     
     try:
-        # Generate shared summary ONCE
-        print("🚀 OPTIMIZATION: Generating shared content summary once...")
-        start_time = datetime.datetime.utcnow()
-        
-        content_summary = generate_content_summary_sync(
-            tenant_id=tenant_id,
-            chapter_id=request.chapter_id,
-            learning_objectives=request.learning_objectives,
-            all_keys=question_service.available_keys
-        )   
-        
-        summary_time = (datetime.datetime.utcnow() - start_time).total_seconds()
-        print(f"✅ Shared summary generated in {summary_time:.2f} seconds (length: {len(content_summary)} characters)")
-        
         # Calculate question distribution
-        question_dist = question_service.calculate_question_distribution(
+        per_type = question_service.calculate_question_distribution(
             request.total_questions,
             request.question_type_distribution,
             request.difficulty_distribution,
             request.blooms_taxonomy_distribution
         )
         
-        print(f"Question distribution: {question_dist}")
+        logger.info("Question distribution: %s", per_type)
         
-        # Group by question type for generation
-        type_groups = {}
-        for key, config in question_dist.items():
-            q_type = config['question_type']
-            if q_type not in type_groups:
-                type_groups[q_type] = []
-            type_groups[q_type].append(config)
+        # Generate shared summary ONCE; this also builds the shared query engine the generators reuse
+        logger.info("🚀 OPTIMIZATION: Generating shared content summary once...")
+        start_ns = time.perf_counter_ns()
+        
+        content_summary = await question_service.get_content_summary(
+            tenant_id,
+            request.chapter_id,
+            request.learning_objectives
+        )
+        
+        summary_time = (time.perf_counter_ns() - start_ns) / 1e9
+        logger.info("✅ Shared summary generated in %.2f seconds (length: %d characters)", summary_time, len(content_summary))
         
         # Run question generators in TRUE PARALLEL using the service
-        print("🚀 OPTIMIZATION: Running question generators in TRUE PARALLEL using class-based architecture...")
-        parallel_start_time = datetime.datetime.utcnow()
+        logger.info("🚀 OPTIMIZATION: Running question generators in TRUE PARALLEL using class-based architecture...")
+        parallel_start_ns = time.perf_counter_ns()
         
-        # Create futures for each question type using the service
-        futures = []
+        # Schedule a task for each question type right away so generation starts immediately
+        tasks = []
         
-        for question_type, configs in type_groups.items():
-            # Create combined distributions for this question type
-            total_for_type = sum([config['count'] for config in configs])
-            difficulty_dist_for_type = {}
-            blooms_dist_for_type = {}
-            
-            for config in configs:
-                diff = config['difficulty']
-                blooms = config['blooms_level']
-                count = config['count']
-                
-                if diff not in difficulty_dist_for_type:
-                    difficulty_dist_for_type[diff] = 0
-                if blooms not in blooms_dist_for_type:
-                    blooms_dist_for_type[blooms] = 0
-                    
-                difficulty_dist_for_type[diff] += count / total_for_type
-                blooms_dist_for_type[blooms] += count / total_for_type
-            
-            # Submit task using the service method
-            future = question_service.generate_single_question_type_async(
+        for question_type, type_spec in per_type.items():
+            task = asyncio.create_task(question_service.generate_single_question_type_async(
                 question_type,
-                configs,
+                type_spec,
                 content_summary,  # Pass shared summary
                 tenant_id,
                 request.chapter_id,
-                request.learning_objectives,
-                difficulty_dist_for_type,
-                blooms_dist_for_type
-            )
-            futures.append(future)
+                request.learning_objectives
+            ))
+            tasks.append(task)
         
-        # Wait for all futures to complete
-        print(f"⚡ Running {len(futures)} question generators in parallel using class-based architecture...")
-        results = await asyncio.gather(*futures, return_exceptions=True)
+        # Wait for all tasks to complete; failures come back as error tuples and are raised below
+        logger.info("⚡ Running %d question generators in parallel using class-based architecture...", len(tasks))
+        results = await asyncio.gather(*tasks)
         
-        parallel_time = (datetime.datetime.utcnow() - parallel_start_time).total_seconds()
-        print(f"✅ Class-based parallel question generation completed in {parallel_time:.2f} seconds")
+        parallel_time = (time.perf_counter_ns() - parallel_start_ns) / 1e9
+        logger.info("✅ Class-based parallel question generation completed in %.2f seconds", parallel_time)
         
         # Process results
         for result in results:
-            if isinstance(result, Exception):
-                raise result
-            
             question_type, file_name, question_data, error = result
             
             if error:
@@ -357,46 +396,51 @@ async def generate_questions(sourceId: str, request: QuestionRequest, req: Reque
             files_generated.append(file_name)
             all_question_data[question_type] = question_data
         
-        total_time = (datetime.datetime.utcnow() - start_time).total_seconds()
-        
-        learning_obj_str = f" with learning objectives: {request.learning_objectives}" if request.learning_objectives else ""
+        total_time = (time.perf_counter_ns() - start_ns) / 1e9
         
-        response = QuestionResponse(
-            status=status,
-            message=f"✅ [REFACTORED] Generated {request.total_questions} questions across {len(type_groups)} question types for sourceId: {sourceId}, chapter: {request.chapter_id}{learning_obj_str} in {total_time:.2f} seconds (Summary: {summary_time:.2f}s, Class-based Parallel Generation: {parallel_time:.2f}s)",
-            session_id=session_id,
-            files_generated=files_generated,
-            contentId=request.contentId,
-            chapter_id=request.chapter_id,
-            learning_objectives=request.learning_objectives,
-            total_questions=request.total_questions,
-            question_type_distribution=request.question_type_distribution,
-            difficulty_distribution=request.difficulty_distribution,
-            blooms_taxonomy_distribution=request.blooms_taxonomy_distribution,
-            data=all_question_data
+        logger.info(
+            "✅ [REFACTORED] Generated %d questions across %d question types for sourceId: %s, chapter: %s "
+            "in %.2f seconds (Summary: %.2fs, Class-based Parallel Generation: %.2fs)",
+            request.total_questions, len(per_type), sourceId, request.chapter_id,
+            total_time, summary_time, parallel_time
         )
         
+        # FastAPI validates the returned dict against response_model once
+        response = {
+            "status": status,
+            "message": "✅ [REFACTORED] Questions generated successfully",
+            "timings": {
+                "summary_s": summary_time,
+                "parallel_s": parallel_time,
+                "total_s": total_time
+            },
+            "session_id": session_id,
+            "files_generated": files_generated,
+            "contentId": request.contentId,
+            "chapter_id": request.chapter_id,
+            "learning_objectives": request.learning_objectives,
+            "total_questions": request.total_questions,
+            "question_type_distribution": request.question_type_distribution,
+            "difficulty_distribution": request.difficulty_distribution,
+            "blooms_taxonomy_distribution": request.blooms_taxonomy_distribution,
+            "data": all_question_data
+        }
+        
     except Exception as e:
-        import traceback
         error_message = str(e)
-        error_details = traceback.format_exc()
-        print(f"Full error details: {error_details}")
+        logger.exception("Error generating questions for sourceId %s", sourceId)
         status = "error"
-        response = QuestionResponse(
-            status=status,
-            message=f"❌ Error generating questions for sourceId {sourceId}: {error_message}",
-            session_id=session_id,
-            contentId=request.contentId,
-            chapter_id=request.chapter_id,
-            learning_objectives=request.learning_objectives,
-            total_questions=request.total_questions,
-            question_type_distribution=request.question_type_distribution,
-            difficulty_distribution=request.difficulty_distribution,
-            blooms_taxonomy_distribution=request.blooms_taxonomy_distribution,
-            files_generated=[],
-            data={}
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "status": status,
+                "message": f"❌ Error generating questions for sourceId {sourceId}: {error_message}",
+                "session_id": session_id,
+                "contentId": request.contentId,
+                "chapter_id": request.chapter_id,
+                "learning_objectives": request.learning_objectives
+            }
         )
-        raise HTTPException(status_code=500, detail=f"Error generating questions: {error_message}")
     
     return response
 
@@ -15,7 +15,7 @@ Example usage:
     mcq_generator = QuestionGeneratorFactory.create_generator('mcq', tenant_id='1305101920')
     
     # Generate questions
-    questions = mcq_generator.generate(
+    questions, filename = mcq_generator.generate(
         chapter_id='01_01920_ch01_ptg01_hires_001-026',
         num_questions=10,
         difficulty_distribution={'basic': 0.3, 'intermediate': 0.3, 'advanced': 0.4},
@@ -26,12 +26,24 @@ Example usage:
     generators = QuestionGeneratorFactory.create_multiple_generators(['mcq', 'fib', 'tf'])
 """
 
+import importlib
+
 from .base_generator import BaseQuestionGenerator
-from .mcq_generator import MCQGenerator
-from .fib_generator import FillInBlankGenerator
-from .tf_generator import TrueFalseGenerator
 from .factory import QuestionGeneratorFactory
 
+# Concrete generators are imported on first attribute access
+_lazy_generators = {
+    'MCQGenerator': '.mcq_generator',
+    'FillInBlankGenerator': '.fib_generator',
+    'TrueFalseGenerator': '.tf_generator'
+}
+
+
+def __getattr__(name):
+    if name in _lazy_generators:
+        return getattr(importlib.import_module(_lazy_generators[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'BaseQuestionGenerator',
     'MCQGenerator', 
@@ -1,31 +1,141 @@
 """
 Base question generator class with shared functionality for all question types.
 """
-import json
 import uuid
+import functools
+import logging
 import os
 import sys
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Union, Tuple
+from itertools import chain, repeat
+from typing import TYPE_CHECKING, Dict, List, Optional, Union, Tuple
 
-# Add project root to Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import numpy as np
+from cachetools import LRUCache, TTLCache
+
+# Add project root to Python path when this module is run outside the package
+if __package__ in (None, ''):
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from src import settings
 from src.settings import NeptuneEndpoint, VectorStoreEndpoint
-from src.utils.constants import CENGAGE_GUIDELINES as cengage_guidelines, metadata_keys
-from src.utils.helpers import get_difficulty_description, get_blooms_question_guidelines
+from src.utils.constants import CENGAGE_GUIDELINES as cengage_guidelines, AVAILABLE_KEYS, HAS_LO_KEY, DEFAULT_FILTER_KEY
+from src.utils.helpers import get_difficulty_description, get_blooms_question_guidelines, dump_questions_json
+
+# GraphRAG and LlamaIndex are heavy to import, so they are only loaded once a generator
+# actually talks to the stores; type checkers still see them here
+if TYPE_CHECKING:
+    from llama_index.core.vector_stores.types import MetadataFilter
+
+logger = logging.getLogger(__name__)
+
+# Content summaries shared by all generators and the API, keyed by the same normalized
+# (tenant_id, chapter_id, learning objectives) that selects the query filters, so MCQ/FIB/TF
+# runs for the same chapter reuse one summary prefix instead of regenerating it.
+# Bounded and expiring, so a long-running server does not grow it forever.
+_summary_cache: TTLCache = TTLCache(maxsize=512, ttl=3600)
+_summary_cache_lock = threading.Lock()
+
+
+def _normalize_learning_objectives(learning_objectives: Optional[Union[str, List[str]]]) -> Tuple[str, ...]:
+    """Learning objectives as the tuple used for query filters and summary cache keys."""
+    if learning_objectives is None or not HAS_LO_KEY:
+        return ()
+    return tuple(learning_objectives) if isinstance(learning_objectives, list) else (learning_objectives,)
+
+
+@functools.lru_cache(maxsize=512)
+def _calc_breakdown(num_questions: int, diff_items: Tuple[Tuple[str, float], ...],
+                    blooms_items: Tuple[Tuple[str, float], ...]) -> Dict[str, Dict]:
+    """
+    Cached question breakdown for a (num_questions, difficulty items, blooms items) combination.
+    
+    Uses largest-remainder (Hamilton) apportionment so the counts always sum to num_questions.
+    """
+    d_keys, d_vals = zip(*diff_items)
+    b_keys, b_vals = zip(*blooms_items)
+    
+    ratios = np.outer(d_vals, b_vals).ravel() * num_questions
+    counts = np.floor(ratios).astype(int)
+    deficit = num_questions - int(counts.sum())
+    
+    if deficit > 0:
+        # Hand the missing questions to the combinations with the largest fractional parts
+        order = np.argsort(-(ratios - counts), kind='stable')
+        np.add.at(counts, np.resize(order, deficit), 1)
+    elif deficit < 0:
+        # Ratios summed to more than one; trim from the largest groups
+        for _ in range(-deficit):
+            counts[np.argmax(counts)] -= 1
+    
+    question_breakdown = {}
+    for index in np.flatnonzero(counts):
+        difficulty = d_keys[index // len(b_keys)]
+        blooms = b_keys[index % len(b_keys)]
+        question_breakdown[f"{difficulty}_{blooms}"] = {
+            'difficulty': difficulty,
+            'blooms_level': blooms,
+            'count': int(counts[index])
+        }
+    
+    return question_breakdown
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_filters(chapter_key: str, chapter_id: str,
+                    lo_tuple: Tuple[str, ...]) -> Tuple['MetadataFilter', ...]:
+    """
+    Cached metadata filters for a chapter and normalized learning objectives.
+    
+    The returned filters are shared between callers and must not be mutated.
+    """
+    from llama_index.core.vector_stores.types import MetadataFilter, FilterOperator
+    
+    filters = [MetadataFilter(key=chapter_key, value=chapter_id, operator=FilterOperator.EQ)]
+    
+    if len(lo_tuple) > 1:
+        filters.append(MetadataFilter(key='learning_objectives', value=list(lo_tuple), operator=FilterOperator.IN))
+    elif lo_tuple:
+        filters.append(MetadataFilter(key='learning_objectives', value=lo_tuple[0], operator=FilterOperator.EQ))
+    
+    return tuple(filters)
+
+
+@functools.lru_cache(maxsize=512)
+def _make_filename(chapter_id: str, qtype: str, diff_items: Tuple[Tuple[str, float], ...],
+                   blooms_items: Tuple[Tuple[str, float], ...],
+                   lo_tuple: Optional[Union[str, Tuple[str, ...]]]) -> str:
+    """Cached output filename for a chapter, question type, distributions and learning objectives."""
+    difficulty_str = "_".join([f"{diff}{int(prop*100)}" for diff, prop in diff_items])
+    blooms_str = "_".join([f"{bloom}{int(prop*100)}" for bloom, prop in blooms_items])
+    
+    filename_parts = [chapter_id, difficulty_str, blooms_str]
+    if lo_tuple:
+        obj_str = "lo" + ("_".join([str(obj) for obj in lo_tuple]) if isinstance(lo_tuple, tuple) else str(lo_tuple))
+        filename_parts.append(obj_str)
+    
+    return "_".join(filename_parts) + f"_{qtype}.json"
+
+
+# Per-combination guideline fragment inserted into every generator's prompt
+_GUIDELINE_TEMPLATE = """
+For {count} questions at {difficulty} difficulty and {blooms_level} Bloom's level:
+- Difficulty: {difficulty_desc}
+- Bloom's Level Guidelines: {guidelines}
+            """
 
-from graphrag_toolkit.lexical_graph.storage import (
-    GraphStoreFactory,
-    VectorStoreFactory
-)
-from graphrag_toolkit.lexical_graph import LexicalGraphQueryEngine
-from graphrag_toolkit.lexical_graph.metadata import FilterConfig
-from llama_index.core.vector_stores.types import (
-    MetadataFilter,
-    FilterOperator
-)
+
+@functools.lru_cache(maxsize=512)
+def _guideline_block(question_type: str, count: int, difficulty: str, blooms_level: str) -> str:
+    """Cached guideline fragment for a (question type, count, difficulty, Bloom's level) combination."""
+    return _GUIDELINE_TEMPLATE.format(
+        count=count,
+        difficulty=difficulty.upper(),
+        blooms_level=blooms_level.upper(),
+        difficulty_desc=get_difficulty_description(difficulty),
+        guidelines=get_blooms_question_guidelines(blooms_level, question_type)
+    )
 
 
 class BaseQuestionGenerator(ABC):
@@ -34,6 +144,30 @@ class BaseQuestionGenerator(ABC):
     Contains shared functionality for GraphRAG integration, filtering, and question breakdown.
     """
     
+    # Graph and vector store clients shared by all generator instances, created on first use
+    _shared_graph_store = None
+    _shared_vector_store = None
+    _shared_stores_lock = threading.Lock()
+    
+    # Query engines keyed by (tenant_id, filter signature). Engines are never mutated after
+    # construction, so concurrent generators for different chapters cannot see each other's filters.
+    # A cached engine is queried from several worker threads at once; this relies on
+    # LexicalGraphQueryEngine.query keeping no per-query state on the engine (its filters and
+    # LLM config are fixed at construction). If that stops holding, cache engines per borrowed
+    # generator instead.
+    _engine_cache = LRUCache(maxsize=64)
+    _engine_cache_lock = threading.Lock()
+    # Per-key build locks so concurrent cold callers wait for one engine build instead of racing
+    _engine_build_locks: Dict[Tuple, threading.Lock] = {}
+    
+    # LLM settings shared by every query engine
+    _llm_config = {
+        "model": "arn:aws:bedrock:us-east-1:051826717360:inference-profile/us.anthropic.claude-3-7-sonnet-20250219-v1:0",
+        "temperature": 0,
+        "max_tokens": 10000,
+        "system_prompt": cengage_guidelines
+    }
+    
     def __init__(self, tenant_id: str = 'cx2201'):
         """
         Initialize the base question generator.
@@ -42,43 +176,125 @@ class BaseQuestionGenerator(ABC):
             tenant_id: The tenant ID for the GraphRAG query engine
         """
         self.tenant_id = tenant_id
-        self.available_keys = list(set(metadata_keys.keys()))
-        self.chapter_key = 'toc_level_1_title'
+        self.chapter_key = DEFAULT_FILTER_KEY
         
         # Initialize GraphRAG components (will be set up when needed)
         self._graph_store = None
         self._vector_store = None
         self._query_engine = None
     
-    def _initialize_graphrag_components(self, filters: List[MetadataFilter]):
+    @classmethod
+    def _get_shared_stores(cls):
+        """
+        Get the process-wide graph and vector stores, creating them on first use.
+        
+        Returns:
+            Tuple of (graph_store, vector_store)
+        """
+        from graphrag_toolkit.lexical_graph.storage import GraphStoreFactory, VectorStoreFactory
+        
+        with cls._shared_stores_lock:
+            if BaseQuestionGenerator._shared_graph_store is None:
+                BaseQuestionGenerator._shared_graph_store = GraphStoreFactory.for_graph_store(NeptuneEndpoint)
+            if BaseQuestionGenerator._shared_vector_store is None:
+                BaseQuestionGenerator._shared_vector_store = VectorStoreFactory.for_vector_store(VectorStoreEndpoint)
+        
+        return BaseQuestionGenerator._shared_graph_store, BaseQuestionGenerator._shared_vector_store
+    
+    @classmethod
+    def _get_query_engine(cls, tenant_id: str, filters: Tuple['MetadataFilter', ...]):
+        """
+        Get the shared query engine for a tenant and set of filters, creating it on first use.
+        
+        Args:
+            tenant_id: The tenant ID for the GraphRAG query engine
+            filters: Metadata filters to apply
+            
+        Returns:
+            LexicalGraphQueryEngine instance (shared; do not mutate)
+        """
+        from graphrag_toolkit.lexical_graph import LexicalGraphQueryEngine
+        from graphrag_toolkit.lexical_graph.metadata import FilterConfig
+        
+        key = (tenant_id, cls._filters_signature(filters))
+        with cls._engine_cache_lock:
+            engine = cls._engine_cache.get(key)
+            if engine is not None:
+                return engine
+            build_lock = cls._engine_build_locks.setdefault(key, threading.Lock())
+        
+        with build_lock:
+            # Another caller may have finished the build while this one waited
+            with cls._engine_cache_lock:
+                engine = cls._engine_cache.get(key)
+            if engine is not None:
+                return engine
+            
+            try:
+                graph_store, vector_store = cls._get_shared_stores()
+                engine = LexicalGraphQueryEngine.for_traversal_based_search(
+                    graph_store,
+                    vector_store,
+                    filter_config=FilterConfig(source_filters=list(filters)),
+                    tenant_id=tenant_id,
+                    llm_config=cls._llm_config
+                )
+                with cls._engine_cache_lock:
+                    cls._engine_cache[key] = engine
+            finally:
+                with cls._engine_cache_lock:
+                    cls._engine_build_locks.pop(key, None)
+        
+        return engine
+    
+    @classmethod
+    def get_shared_query_engine(cls, tenant_id: str, chapter_id: str, learning_objectives: Tuple[str, ...] = ()):
+        """
+        Get the query engine the generators use for a chapter and learning objectives.
+        
+        Lets other callers (such as the summary helper) share the generators'
+        stores and engines instead of building their own.
+        
+        Args:
+            tenant_id: The tenant ID for the GraphRAG query engine
+            chapter_id: The chapter identifier
+            learning_objectives: Learning objectives to filter on; empty for none
+            
+        Returns:
+            LexicalGraphQueryEngine instance (shared; do not mutate)
+        """
+        logger.debug("Query filters: %s=%s, learning_objectives=%s", DEFAULT_FILTER_KEY, chapter_id, learning_objectives)
+        return cls._get_query_engine(tenant_id, _cached_filters(DEFAULT_FILTER_KEY, chapter_id, tuple(learning_objectives)))
+    
+    def _initialize_graphrag_components(self, filters: Tuple['MetadataFilter', ...]):
         """
         Initialize GraphRAG components with the specified filters.
         
         Args:
-            filters: List of metadata filters to apply
-        """
-        if self._graph_store is None:
-            self._graph_store = GraphStoreFactory.for_graph_store(NeptuneEndpoint)
-        
-        if self._vector_store is None:
-            self._vector_store = VectorStoreFactory.for_vector_store(VectorStoreEndpoint)
-        
-        filter_config = FilterConfig(source_filters=filters)
-        
-        self._query_engine = LexicalGraphQueryEngine.for_traversal_based_search(
-            self._graph_store,
-            self._vector_store,
-            filter_config=filter_config,
-            tenant_id=self.tenant_id,
-            llm_config={
-                "model": "arn:aws:bedrock:us-east-1:051826717360:inference-profile/us.anthropic.claude-3-7-sonnet-20250219-v1:0",
-                "temperature": 0,
-                "max_tokens": 10000,
-                "system_prompt": cengage_guidelines
-            }
+            filters: Metadata filters to apply
+        """
+        if self._graph_store is None or self._vector_store is None:
+            self._graph_store, self._vector_store = self._get_shared_stores()
+        
+        self._query_engine = self._get_query_engine(self.tenant_id, filters)
+    
+    @staticmethod
+    def _filters_signature(filters: Tuple['MetadataFilter', ...]) -> Tuple:
+        """
+        Build a hashable signature for a list of metadata filters.
+        
+        Args:
+            filters: Metadata filters
+            
+        Returns:
+            Tuple of (key, value, operator) triples
+        """
+        return tuple(
+            (f.key, tuple(f.value) if isinstance(f.value, list) else f.value, str(f.operator))
+            for f in filters
         )
     
-    def _build_filters(self, chapter_id: str, learning_objectives: Optional[Union[str, List[str]]] = None) -> List[MetadataFilter]:
+    def _build_filters(self, chapter_id: str, learning_objectives: Optional[Union[str, List[str]]] = None) -> Tuple['MetadataFilter', ...]:
         """
         Build metadata filters for GraphRAG queries.
         
@@ -87,42 +303,14 @@ class BaseQuestionGenerator(ABC):
             learning_objectives: Optional learning objectives to filter on
             
         Returns:
-            List of metadata filters
+            Tuple of metadata filters (cached; do not mutate)
         """
-        filters = []
+        lo_tuple = _normalize_learning_objectives(learning_objectives)
+        if learning_objectives is not None and not HAS_LO_KEY:
+            logger.warning("'learning_objectives' filter requested but 'learning_objectives' key not found in metadata.")
         
-        # Primary filter for chapter (always present)
-        chapter_filter = MetadataFilter(
-            key=self.chapter_key,
-            value=chapter_id,
-            operator=FilterOperator.EQ
-        )
-        filters.append(chapter_filter)
-        print(f"Added chapter filter: {self.chapter_key}={chapter_id}")
-        
-        # Add learning objectives filter if available
-        if learning_objectives is not None and 'learning_objectives' in self.available_keys:
-            if isinstance(learning_objectives, list) and len(learning_objectives) > 1:
-                print(f"Adding learning_objectives filter: IN operator with values: {learning_objectives}")
-                lo_filter = MetadataFilter(
-                    key='learning_objectives',
-                    value=learning_objectives,
-                    operator=FilterOperator.IN
-                )
-                filters.append(lo_filter)
-            else:
-                value = learning_objectives[0] if isinstance(learning_objectives, list) else learning_objectives
-                print(f"Adding learning_objectives filter: EQ operator with value: {value}")
-                lo_filter = MetadataFilter(
-                    key='learning_objectives',
-                    value=value,
-                    operator=FilterOperator.EQ
-                )
-                filters.append(lo_filter)
-        elif learning_objectives is not None:
-            print("Warning: 'learning_objectives' filter requested but 'learning_objectives' key not found in metadata.")
-        
-        return filters
+        logger.debug("Query filters: %s=%s, learning_objectives=%s", self.chapter_key, chapter_id, lo_tuple)
+        return _cached_filters(self.chapter_key, chapter_id, lo_tuple)
     
     def _calculate_question_breakdown(self, num_questions: int, difficulty_distribution: Dict[str, float], 
                                     blooms_taxonomy_distribution: Dict[str, float]) -> Dict[str, Dict]:
@@ -137,26 +325,14 @@ class BaseQuestionGenerator(ABC):
         Returns:
             Dictionary with question breakdown specifications
         """
-        question_breakdown = {}
-        
-        for difficulty, diff_ratio in difficulty_distribution.items():
-            for blooms, blooms_ratio in blooms_taxonomy_distribution.items():
-                count = int(round(num_questions * diff_ratio * blooms_ratio))
-                if count > 0:
-                    question_breakdown[f"{difficulty}_{blooms}"] = {
-                        'difficulty': difficulty,
-                        'blooms_level': blooms,
-                        'count': count
-                    }
-        
-        # Adjust to ensure total matches exactly
-        total_calculated = sum([item['count'] for item in question_breakdown.values()])
-        if total_calculated != num_questions:
-            # Add/subtract from the largest group
-            largest_key = max(question_breakdown.keys(), key=lambda k: question_breakdown[k]['count'])
-            question_breakdown[largest_key]['count'] += (num_questions - total_calculated)
-        
-        return question_breakdown
+        # Distribution order is significant (it drives breakdown and sequence order), so items are not sorted
+        breakdown = _calc_breakdown(
+            num_questions,
+            tuple(difficulty_distribution.items()),
+            tuple(blooms_taxonomy_distribution.items())
+        )
+        # Hand out a copy so callers cannot mutate the cached breakdown
+        return {key: dict(specs) for key, specs in breakdown.items()}
     
     def _create_question_sequence(self, question_breakdown: Dict[str, Dict]) -> List[Tuple[str, str]]:
         """
@@ -168,17 +344,118 @@ class BaseQuestionGenerator(ABC):
         Returns:
             List of tuples containing difficulty and blooms level for each question
         """
-        sequence = []
-        for combo_key, specs in question_breakdown.items():
-            difficulty = specs['difficulty']
-            blooms_level = specs['blooms_level']
-            count = specs['count']
+        # Common case: a single combination, so every question gets the same levels
+        if len(question_breakdown) == 1:
+            specs = next(iter(question_breakdown.values()))
+            return [(specs['difficulty'], specs['blooms_level'])] * specs['count']
+        
+        # Repeat each combination 'count' times, in breakdown order
+        return list(chain.from_iterable(
+            repeat((specs['difficulty'], specs['blooms_level']), specs['count'])
+            for specs in question_breakdown.values()
+        ))
+    
+    def _build_guidelines(self, question_breakdown: Dict[str, Dict]) -> str:
+        """
+        Build the prompt guidelines for every combination in the question breakdown.
+        
+        Args:
+            question_breakdown: Question breakdown specifications
+            
+        Returns:
+            Guideline text for the generation prompt
+        """
+        question_type = self.get_question_type()
+        return "\n".join(
+            _guideline_block(question_type, specs['count'], specs['difficulty'], specs['blooms_level'])
+            for specs in question_breakdown.values()
+        )
+    
+    @staticmethod
+    def summary_cache_key(tenant_id: str, chapter_id: str,
+                          learning_objectives: Optional[Union[str, List[str]]] = None) -> Tuple[str, str, Tuple[str, ...]]:
+        """
+        Build the shared summary cache key for a chapter and its learning objectives.
+        
+        Args:
+            tenant_id: The tenant ID for the GraphRAG query engine
+            chapter_id: The chapter identifier
+            learning_objectives: Optional learning objectives to filter on
+            
+        Returns:
+            Hashable cache key
+        """
+        return (tenant_id, chapter_id, _normalize_learning_objectives(learning_objectives))
+    
+    @classmethod
+    def get_cached_summary(cls, tenant_id: str, chapter_id: str,
+                           learning_objectives: Optional[Union[str, List[str]]] = None) -> Optional[str]:
+        """
+        Look up a shared cached content summary.
+        
+        Args:
+            tenant_id: The tenant ID for the GraphRAG query engine
+            chapter_id: The chapter identifier
+            learning_objectives: Optional learning objectives to filter on
+            
+        Returns:
+            Cached content summary, or None if there is none
+        """
+        with _summary_cache_lock:
+            return _summary_cache.get(cls.summary_cache_key(tenant_id, chapter_id, learning_objectives))
+    
+    @classmethod
+    def cache_summary(cls, tenant_id: str, chapter_id: str,
+                      learning_objectives: Optional[Union[str, List[str]]], content_summary: str):
+        """
+        Store a content summary in the shared cache.
+        
+        Args:
+            tenant_id: The tenant ID for the GraphRAG query engine
+            chapter_id: The chapter identifier
+            learning_objectives: Optional learning objectives to filter on
+            content_summary: Content summary to cache
+        """
+        with _summary_cache_lock:
+            _summary_cache[cls.summary_cache_key(tenant_id, chapter_id, learning_objectives)] = content_summary
+    
+    def _lookup_content_summary(self, chapter_id: str,
+                                learning_objectives: Optional[Union[str, List[str]]] = None) -> Optional[str]:
+        """
+        Look up a shared cached content summary for this generator's tenant.
+        
+        Args:
+            chapter_id: The chapter identifier
+            learning_objectives: Optional learning objectives to filter on
             
-            # Add this combination 'count' times to the sequence
-            for _ in range(count):
-                sequence.append((difficulty, blooms_level))
+        Returns:
+            Cached content summary, or None if there is none
+        """
+        return self.get_cached_summary(self.tenant_id, chapter_id, learning_objectives)
+    
+    def _store_content_summary(self, chapter_id: str, learning_objectives: Optional[Union[str, List[str]]],
+                               content_summary: str):
+        """
+        Store a content summary in the shared cache for this generator's tenant.
         
-        return sequence
+        Args:
+            chapter_id: The chapter identifier
+            learning_objectives: Optional learning objectives to filter on
+            content_summary: Content summary to cache
+        """
+        self.cache_summary(self.tenant_id, chapter_id, learning_objectives, content_summary)
+    
+    @staticmethod
+    def release_cache(chapter_id: str):
+        """
+        Drop every cached content summary for the specified chapter.
+        
+        Args:
+            chapter_id: The chapter identifier
+        """
+        with _summary_cache_lock:
+            for key in [key for key in _summary_cache if key[1] == chapter_id]:
+                del _summary_cache[key]
     
     def _generate_content_summary(self, chapter_id: str, learning_objectives: Optional[Union[str, List[str]]] = None) -> str:
         """
@@ -192,15 +469,15 @@ class BaseQuestionGenerator(ABC):
             Content summary string
         """
         filter_description = f"chapter {chapter_id}"
-        if learning_objectives and 'learning_objectives' in self.available_keys:
+        if learning_objectives and HAS_LO_KEY:
             filter_description += f" with learning objectives: {learning_objectives if isinstance(learning_objectives, list) else [learning_objectives]}"
         
         summary_query = f"Provide a comprehensive summary of content for {filter_description}. Include key concepts, topics, and important details."
-        print("Retrieving content summary...")
+        logger.debug("Retrieving content summary...")
         
         summary_response = self._query_engine.query(summary_query)
         content_summary = summary_response.response
-        print(f"Summary length: {len(content_summary)} characters")
+        logger.debug("Summary length: %d characters", len(content_summary))
         
         return content_summary
     
@@ -219,15 +496,17 @@ class BaseQuestionGenerator(ABC):
         Returns:
             Generated filename
         """
-        difficulty_str = "_".join([f"{diff}{int(prop*100)}" for diff, prop in difficulty_distribution.items()])
-        blooms_str = "_".join([f"{bloom}{int(prop*100)}" for bloom, prop in blooms_taxonomy_distribution.items()])
-        
-        filename_parts = [chapter_id, difficulty_str, blooms_str]
-        if learning_objectives and 'learning_objectives' in self.available_keys:
-            obj_str = "lo" + ("_".join([str(obj) for obj in learning_objectives]) if isinstance(learning_objectives, list) else str(learning_objectives))
-            filename_parts.append(obj_str)
-        
-        return "_".join(filename_parts) + f"_{self.get_question_type()}.json"
+        lo_tuple = None
+        if learning_objectives and HAS_LO_KEY:
+            lo_tuple = tuple(learning_objectives) if isinstance(learning_objectives, list) else learning_objectives
+        
+        return _make_filename(
+            chapter_id,
+            self.get_question_type(),
+            tuple(difficulty_distribution.items()),
+            tuple(blooms_taxonomy_distribution.items()),
+            lo_tuple
+        )
     
     def _save_questions_to_file(self, questions: List[Dict], filename: str):
         """
@@ -241,10 +520,10 @@ class BaseQuestionGenerator(ABC):
             "response": questions
         }
         
-        with open(filename, 'w') as json_file:
-            json.dump(json_responses, json_file, indent=4)
+        with open(filename, 'wb') as json_file:
+            json_file.write(dump_questions_json(json_responses))
         
-        print(f"Generated {self.get_question_type()} questions and saved to {filename}")
+        logger.info("Generated %s questions and saved to %s", self.get_question_type(), filename)
     
     @abstractmethod
     def get_question_type(self) -> str:
@@ -289,7 +568,7 @@ class BaseQuestionGenerator(ABC):
     def generate(self, chapter_id: str, learning_objectives: Optional[Union[str, List[str]]] = None,
                 num_questions: int = 10, difficulty_distribution: Dict[str, float] = {'advanced': 1.0},
                 blooms_taxonomy_distribution: Dict[str, float] = {'analyze': 1.0},
-                content_summary: Optional[str] = None) -> str:
+                content_summary: Optional[str] = None, save_to_file: bool = True) -> Tuple[Dict, str]:
         """
         Generate questions for the specified parameters.
         
@@ -300,45 +579,54 @@ class BaseQuestionGenerator(ABC):
             difficulty_distribution: Distribution of difficulty levels
             blooms_taxonomy_distribution: Distribution of Bloom's taxonomy levels
             content_summary: Pre-generated content summary (optional)
+            save_to_file: Whether to also persist the questions to a JSON file
             
         Returns:
-            Generated questions text
+            Tuple of (questions dictionary, filename)
         """
-        print(f"Generating {num_questions} {self.get_question_type()} questions for chapter: {chapter_id}")
-        if learning_objectives:
-            print(f"Learning objectives filter: {learning_objectives}")
-        print(f"Available metadata keys: {self.available_keys}")
-        print(f"Difficulty distribution: {difficulty_distribution}")
-        print(f"Bloom's taxonomy distribution: {blooms_taxonomy_distribution}")
+        logger.info("Generating %d %s questions for chapter: %s", num_questions, self.get_question_type(), chapter_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            if learning_objectives:
+                logger.debug("Learning objectives filter: %s", learning_objectives)
+            logger.debug("Available metadata keys: %s", sorted(AVAILABLE_KEYS))
+            logger.debug("Difficulty distribution: %s", difficulty_distribution)
+            logger.debug("Bloom's taxonomy distribution: %s", blooms_taxonomy_distribution)
         
         # Build filters and initialize GraphRAG components
         filters = self._build_filters(chapter_id, learning_objectives)
         self._initialize_graphrag_components(filters)
         
-        # Generate or use provided content summary
+        # Generate or use provided content summary, reusing one cached by another generator if possible
         if content_summary is None:
-            print("Warning: No content summary provided, generating new one...")
-            content_summary = self._generate_content_summary(chapter_id, learning_objectives)
+            content_summary = self._lookup_content_summary(chapter_id, learning_objectives)
+            if content_summary is None:
+                logger.warning("No content summary provided, generating new one...")
+                content_summary = self._generate_content_summary(chapter_id, learning_objectives)
+                self._store_content_summary(chapter_id, learning_objectives, content_summary)
+            else:
+                logger.debug("Using cached content summary (length: %d characters)", len(content_summary))
         else:
-            print(f"Using provided content summary (length: {len(content_summary)} characters)")
+            logger.debug("Using provided content summary (length: %d characters)", len(content_summary))
         
         # Calculate question breakdown
         question_breakdown = self._calculate_question_breakdown(
             num_questions, difficulty_distribution, blooms_taxonomy_distribution
         )
-        print(f"Question breakdown: {question_breakdown}")
+        logger.debug("Question breakdown: %s", question_breakdown)
         
         # Build generation prompt
         generation_prompt = self._build_generation_prompt(content_summary, num_questions, question_breakdown)
         
         # Generate questions
-        print(f"Generating {self.get_question_type()} questions...")
+        logger.debug("Generating %s questions...", self.get_question_type())
         response = self._query_engine.query(generation_prompt)
         response_text = response.response
         
-        # Parse response and save to file
+        # Parse response and optionally save to file
         questions = self._parse_response(response_text, question_breakdown)
+        question_data = {"response": questions}
         filename = self._generate_filename(chapter_id, difficulty_distribution, blooms_taxonomy_distribution, learning_objectives)
-        self._save_questions_to_file(questions, filename)
+        if save_to_file:
+            self._save_questions_to_file(questions, filename)
         
-        return response_text
+        return question_data, filename
@@ -1,11 +1,13 @@
 """
 Factory class for creating question generators.
 """
-from typing import Optional
+import asyncio
+import concurrent.futures
+import importlib
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
 from .base_generator import BaseQuestionGenerator
-from .mcq_generator import MCQGenerator
-from .fib_generator import FillInBlankGenerator
-from .tf_generator import TrueFalseGenerator
 
 
 class QuestionGeneratorFactory:
@@ -13,11 +15,19 @@ class QuestionGeneratorFactory:
     Factory class for creating appropriate question generators based on question type.
     """
     
-    _generators = {
-        'mcq': MCQGenerator,
-        'fib': FillInBlankGenerator,
-        'tf': TrueFalseGenerator
+    # Generator classes by question type as (module, class name), imported on first use
+    _generator_paths = {
+        'mcq': ('src.generators.mcq_generator', 'MCQGenerator'),
+        'fib': ('src.generators.fib_generator', 'FillInBlankGenerator'),
+        'tf': ('src.generators.tf_generator', 'TrueFalseGenerator')
     }
+    _loaded: Dict[str, Type[BaseQuestionGenerator]] = {}
+    
+    # Pool of idle, warm generator instances keyed by (tenant_id, question_type).
+    # Generators keep per-call state (query engine, filters), so an instance is
+    # only ever lent to one caller at a time.
+    _pool: Dict[Tuple[str, str], List[BaseQuestionGenerator]] = {}
+    _pool_lock = threading.Lock()
     
     @classmethod
     def create_generator(cls, question_type: str, tenant_id: str = 'cx2201') -> Optional[BaseQuestionGenerator]:
@@ -34,13 +44,48 @@ class QuestionGeneratorFactory:
         Raises:
             ValueError: If question_type is not supported
         """
-        if question_type not in cls._generators:
-            supported_types = ', '.join(cls._generators.keys())
-            raise ValueError(f"Unsupported question type: {question_type}. Supported types: {supported_types}")
+        cls._check_supported([question_type])
         
-        generator_class = cls._generators[question_type]
+        generator_class = cls._loaded.get(question_type)
+        if generator_class is None:
+            module_path, class_name = cls._generator_paths[question_type]
+            generator_class = getattr(importlib.import_module(module_path), class_name)
+            cls._loaded[question_type] = generator_class
         return generator_class(tenant_id=tenant_id)
     
+    @classmethod
+    @contextmanager
+    def borrow_generator(cls, question_type: str, tenant_id: str = 'cx2201') -> Iterator[BaseQuestionGenerator]:
+        """
+        Borrow a reusable generator for the specified type, creating it if none is idle.
+        
+        The generator is returned to the pool when the context exits, so later
+        callers for the same tenant and type skip generator construction.
+        
+        Args:
+            question_type: Type of questions to generate ('mcq', 'fib', 'tf')
+            tenant_id: The tenant ID for the GraphRAG query engine
+            
+        Yields:
+            Question generator instance reserved for the caller
+            
+        Raises:
+            ValueError: If question_type is not supported
+        """
+        key = (tenant_id, question_type)
+        with cls._pool_lock:
+            idle = cls._pool.get(key)
+            generator = idle.pop() if idle else None
+        
+        if generator is None:
+            generator = cls.create_generator(question_type, tenant_id)
+        
+        try:
+            yield generator
+        finally:
+            with cls._pool_lock:
+                cls._pool.setdefault(key, []).append(generator)
+    
     @classmethod
     def get_supported_types(cls) -> list:
         """
@@ -49,7 +94,7 @@ class QuestionGeneratorFactory:
         Returns:
             List of supported question type strings
         """
-        return list(cls._generators.keys())
+        return list(cls._generator_paths.keys())
     
     @classmethod
     def create_multiple_generators(cls, question_types: list, tenant_id: str = 'cx2201') -> dict:
@@ -72,3 +117,168 @@ class QuestionGeneratorFactory:
             generators[question_type] = cls.create_generator(question_type, tenant_id)
         
         return generators
+    
+    @classmethod
+    def get_or_compute_summary(cls, generator: BaseQuestionGenerator, chapter_id: str,
+                               learning_objectives: Optional[Union[str, List[str]]] = None) -> str:
+        """
+        Get the content summary for a chapter, generating it only if no generator has cached one.
+        
+        Args:
+            generator: Generator used to query GraphRAG on a cache miss
+            chapter_id: The chapter identifier
+            learning_objectives: Optional learning objectives to filter on
+            
+        Returns:
+            Content summary string
+        """
+        content_summary = generator._lookup_content_summary(chapter_id, learning_objectives)
+        if content_summary is None:
+            filters = generator._build_filters(chapter_id, learning_objectives)
+            generator._initialize_graphrag_components(filters)
+            content_summary = generator._generate_content_summary(chapter_id, learning_objectives)
+            generator._store_content_summary(chapter_id, learning_objectives, content_summary)
+        
+        return content_summary
+    
+    @classmethod
+    def _check_supported(cls, question_types: list):
+        """
+        Fail fast on unsupported question types before any generation starts.
+        
+        Args:
+            question_types: List of question types to check
+            
+        Raises:
+            ValueError: If any question_type is not supported
+        """
+        for question_type in question_types:
+            if question_type not in cls._generator_paths:
+                supported_types = ', '.join(cls._generator_paths.keys())
+                raise ValueError(f"Unsupported question type: {question_type}. Supported types: {supported_types}")
+    
+    @classmethod
+    def _shared_summary(cls, question_type: str, tenant_id: str, chapter_id: str,
+                        learning_objectives: Optional[Union[str, List[str]]] = None) -> str:
+        """
+        Get the content summary shared by every question type, using a borrowed generator on a cache miss.
+        
+        Returns:
+            Content summary string
+        """
+        with cls.borrow_generator(question_type, tenant_id) as generator:
+            return cls.get_or_compute_summary(generator, chapter_id, learning_objectives)
+    
+    @classmethod
+    def _generate_with_pool(cls, question_type: str, tenant_id: str, chapter_id: str, **kwargs) -> Tuple[Dict, str]:
+        """
+        Generate questions of one type with a generator borrowed from the pool.
+        
+        Returns:
+            Tuple of (questions dictionary, filename)
+        """
+        with cls.borrow_generator(question_type, tenant_id) as generator:
+            return generator.generate(chapter_id, **kwargs)
+    
+    @classmethod
+    def run_all(cls, question_types: list, chapter_id: str, tenant_id: str = 'cx2201',
+                learning_objectives: Optional[Union[str, List[str]]] = None,
+                num_questions: int = 10, difficulty_distribution: Dict[str, float] = {'advanced': 1.0},
+                blooms_taxonomy_distribution: Dict[str, float] = {'analyze': 1.0}) -> dict:
+        """
+        Generate questions for several question types, sharing one content summary.
+        
+        Args:
+            question_types: List of question types to generate
+            chapter_id: The chapter identifier
+            tenant_id: The tenant ID for the GraphRAG query engine
+            learning_objectives: Optional learning objectives to filter on
+            num_questions: Number of questions to generate per question type
+            difficulty_distribution: Distribution of difficulty levels
+            blooms_taxonomy_distribution: Distribution of Bloom's taxonomy levels
+            
+        Returns:
+            Dictionary mapping question types to (questions dictionary, filename) tuples
+            
+        Raises:
+            ValueError: If any question_type is not supported
+        """
+        question_types = list(dict.fromkeys(question_types))
+        cls._check_supported(question_types)
+        if not question_types:
+            return {}
+        
+        content_summary = cls._shared_summary(question_types[0], tenant_id, chapter_id, learning_objectives)
+        
+        return {
+            question_type: cls._generate_with_pool(
+                question_type,
+                tenant_id,
+                chapter_id,
+                learning_objectives=learning_objectives,
+                num_questions=num_questions,
+                difficulty_distribution=difficulty_distribution,
+                blooms_taxonomy_distribution=blooms_taxonomy_distribution,
+                content_summary=content_summary
+            )
+            for question_type in question_types
+        }
+    
+    @classmethod
+    async def generate_all_async(cls, question_types: list, chapter_id: str, tenant_id: str = 'cx2201',
+                                 learning_objectives: Optional[Union[str, List[str]]] = None,
+                                 num_questions: int = 10, difficulty_distribution: Dict[str, float] = {'advanced': 1.0},
+                                 blooms_taxonomy_distribution: Dict[str, float] = {'analyze': 1.0},
+                                 executor: Optional[concurrent.futures.Executor] = None) -> dict:
+        """
+        Generate questions for several question types concurrently.
+        
+        The content summary is generated once and shared by every question type.
+        Generators are borrowed from the pool and run on the given executor.
+        
+        Args:
+            question_types: List of question types to generate
+            chapter_id: The chapter identifier
+            tenant_id: The tenant ID for the GraphRAG query engine
+            learning_objectives: Optional learning objectives to filter on
+            num_questions: Number of questions to generate per question type
+            difficulty_distribution: Distribution of difficulty levels
+            blooms_taxonomy_distribution: Distribution of Bloom's taxonomy levels
+            executor: Executor to run generators on; defaults to the event loop's default executor
+            
+        Returns:
+            Dictionary mapping question types to (questions dictionary, filename) tuples
+            
+        Raises:
+            ValueError: If any question_type is not supported
+        """
+        question_types = list(dict.fromkeys(question_types))
+        cls._check_supported(question_types)
+        if not question_types:
+            return {}
+        
+        loop = asyncio.get_running_loop()
+        
+        # Generate the shared summary once using a borrowed generator
+        content_summary = await loop.run_in_executor(
+            executor, cls._shared_summary, question_types[0], tenant_id, chapter_id, learning_objectives
+        )
+        
+        def _generate(question_type: str) -> Tuple[Dict, str]:
+            return cls._generate_with_pool(
+                question_type,
+                tenant_id,
+                chapter_id,
+                learning_objectives=learning_objectives,
+                num_questions=num_questions,
+                difficulty_distribution=difficulty_distribution,
+                blooms_taxonomy_distribution=blooms_taxonomy_distribution,
+                content_summary=content_summary
+            )
+        
+        results = await asyncio.gather(*[
+            loop.run_in_executor(executor, _generate, question_type)
+            for question_type in question_types
+        ])
+        
+        return dict(zip(question_types, results))
@@ -1,10 +1,64 @@
 """
 Fill-in-the-blank question generator implementation.
 """
-import uuid
+import re
+from itertools import chain, repeat
 from typing import Dict, List
 from .base_generator import BaseQuestionGenerator
-from src.utils.helpers import get_difficulty_description, get_blooms_question_guidelines
+from src.utils.uuid_pool import fast_uuid4_str
+
+# Splits the response into question blocks on "QUESTION:" markers, wherever they appear
+_QUESTION_SPLIT_RE = re.compile(r"\bQUESTION:\s*")
+# Leading "1. " style numbering on an answer line
+_NUM_PREFIX_RE = re.compile(r"\s*\d+\.\s+(.+)")
+
+
+def _iter_question_blocks(response_text: str):
+    """Yield the text following each QUESTION marker one block at a time; text before the first marker is ignored."""
+    matches = _QUESTION_SPLIT_RE.finditer(response_text)
+    first = next(matches, None)
+    if first is None:
+        return
+    start = first.end()
+    for match in matches:
+        yield response_text[start:match.start()]
+        start = match.end()
+    yield response_text[start:]
+
+
+# Static fill-in-the-blank prompt; only the summary, counts, guidelines and breakdown vary per call
+_PROMPT_TEMPLATE = """
+        You are a professor writing sophisticated fill-in-the-blank questions for an upper-level university course. The questions will be based on this chapter summary:
+
+        {content_summary}
+
+        Create exactly {num_questions} fill-in-the-blank questions following these specific guidelines:
+
+        {all_guidelines}
+
+        IMPORTANT FORMATTING INSTRUCTIONS:
+        - Start IMMEDIATELY with your first question using "QUESTION:" 
+        - DO NOT write ANY introductory text like "Based on the chapter..." or "I'll create..."
+        - DO NOT include ANY preamble or explanation before the first question
+        - Each blank should be indicated by "________" (8 underscores)
+        - A question may have multiple blanks if appropriate
+
+        Each question should:
+        1. Match the specified difficulty and Bloom's taxonomy level
+        2. Present statements appropriate to the cognitive level required
+        3. Use domain-specific terminology accurately
+        4. Focus on important concepts from the chapter
+
+        Format each question exactly as follows:
+        QUESTION: [Statement with ________ for blanks, appropriate to difficulty and Bloom's level]
+        ANSWER: [Correct answer(s) that should fill the blank(s), if multiple blanks, list each answer separately]
+        EXPLANATION: [Explanation of why this is the correct answer and how it demonstrates the required cognitive level]
+
+        Distribution of questions:
+        {question_breakdown}
+        
+        Make sure to vary the cognitive demands according to the Bloom's taxonomy levels specified.
+        """
 
 
 class FillInBlankGenerator(BaseQuestionGenerator):
@@ -34,51 +88,36 @@ class FillInBlankGenerator(BaseQuestionGenerator):
             List of parsed fill-in-the-blank dictionaries
         """
         responses = []
-        question_blocks = response_text.split("QUESTION:")
         
-        # Create sequence of difficulty/blooms assignments
-        question_sequence = self._create_question_sequence(question_breakdown)
-        question_index = 0
+        # Difficulty/blooms assignments in question order; questions beyond the breakdown get empty levels
+        question_levels = chain(self._create_question_sequence(question_breakdown), repeat(("", "")))
         
-        for block in [b.strip() for b in question_blocks if b.strip()]:
+        for block in _iter_question_blocks(response_text):
+            # Locate the section markers once and slice the fields directly; like the MCQ and
+            # TF parsers, a question missing a section is kept with that field left empty
+            a_idx = block.find("ANSWER:")
+            e_idx = block.find("EXPLANATION:", a_idx + 7 if a_idx >= 0 else 0)
+            body_end = e_idx if e_idx >= 0 else len(block)
+            
+            difficulty, blooms_level = next(question_levels)
             question_obj = {
-                "question_id": str(uuid.uuid4()),
-                "question": "",
+                "question_id": fast_uuid4_str(),
+                "question": block[:a_idx if a_idx >= 0 else body_end].strip(),
                 "answer": [],
-                "explanation": "",
-                "difficulty": "",
-                "blooms_level": "",
+                "explanation": block[e_idx + 12:].strip() if e_idx >= 0 else "",
+                "difficulty": difficulty,
+                "blooms_level": blooms_level,
                 "question_type": "fib"
             }
+            answer_part = block[a_idx + 7:body_end] if a_idx >= 0 else ""
             
-            # Extract components using simple string search
-            if "ANSWER:" in block:
-                question_obj["question"] = block.split("ANSWER:")[0].strip()
-                block = "ANSWER:" + block.split("ANSWER:")[1]
-            
-            if "ANSWER:" in block and "EXPLANATION:" in block:
-                answer_text = block.split("ANSWER:")[1].split("EXPLANATION:")[0].strip()
-                answer_lines = answer_text.split('\n')
-                for line in answer_lines:
-                    line = line.strip()
-                    # Check if line starts with a number followed by a period (e.g., "1. ")
-                    if line and (line[0].isdigit() and '. ' in line):
-                        # Remove the numbering and add to the list
-                        answer_item = line.split('. ', 1)[1].strip()
-                        question_obj["answer"].append(answer_item)
-                    elif line:  # If there's text but not in numbered format
-                        question_obj["answer"].append(line)
-            
-            if "EXPLANATION:" in block:
-                explanation_text = block.split("EXPLANATION:")[1]
-                question_obj["explanation"] = explanation_text.strip()
-            
-            # Programmatically assign difficulty and blooms_level
-            if question_index < len(question_sequence):
-                difficulty, blooms_level = question_sequence[question_index]
-                question_obj["difficulty"] = difficulty
-                question_obj["blooms_level"] = blooms_level
-                question_index += 1
+            # One answer per non-empty line, with any numbering removed
+            for line in answer_part.splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                num_match = _NUM_PREFIX_RE.match(line)
+                question_obj["answer"].append(num_match.group(1) if num_match else line)
             
             responses.append(question_obj)
 
@@ -97,55 +136,10 @@ class FillInBlankGenerator(BaseQuestionGenerator):
         Returns:
             Fill-in-the-blank generation prompt string
         """
-        # Generate all questions in a single prompt with specific guidelines
-        all_guidelines = []
-        
-        for combo_key, specs in question_breakdown.items():
-            difficulty = specs['difficulty']
-            blooms_level = specs['blooms_level']
-            count = specs['count']
-            
-            guidelines = get_blooms_question_guidelines(blooms_level, "fib")
-            difficulty_desc = get_difficulty_description(difficulty)
-            
-            all_guidelines.append(f"""
-For {count} questions at {difficulty.upper()} difficulty and {blooms_level.upper()} Bloom's level:
-- Difficulty: {difficulty_desc}
-- Bloom's Level Guidelines: {guidelines}
-            """)
-        
         # Generate fill-in-the-blank questions based on summary
-        prompt = f"""
-        You are a professor writing sophisticated fill-in-the-blank questions for an upper-level university course. The questions will be based on this chapter summary:
-
-        {content_summary}
-
-        Create exactly {num_questions} fill-in-the-blank questions following these specific guidelines:
-
-        {' '.join(all_guidelines)}
-
-        IMPORTANT FORMATTING INSTRUCTIONS:
-        - Start IMMEDIATELY with your first question using "QUESTION:" 
-        - DO NOT write ANY introductory text like "Based on the chapter..." or "I'll create..."
-        - DO NOT include ANY preamble or explanation before the first question
-        - Each blank should be indicated by "________" (8 underscores)
-        - A question may have multiple blanks if appropriate
-
-        Each question should:
-        1. Match the specified difficulty and Bloom's taxonomy level
-        2. Present statements appropriate to the cognitive level required
-        3. Use domain-specific terminology accurately
-        4. Focus on important concepts from the chapter
-
-        Format each question exactly as follows:
-        QUESTION: [Statement with ________ for blanks, appropriate to difficulty and Bloom's level]
-        ANSWER: [Correct answer(s) that should fill the blank(s), if multiple blanks, list each answer separately]
-        EXPLANATION: [Explanation of why this is the correct answer and how it demonstrates the required cognitive level]
-
-        Distribution of questions:
-        {question_breakdown}
-        
-        Make sure to vary the cognitive demands according to the Bloom's taxonomy levels specified.
-        """
-        
-        return prompt
+        return _PROMPT_TEMPLATE.format_map({
+            'content_summary': content_summary,
+            'num_questions': num_questions,
+            'all_guidelines': self._build_guidelines(question_breakdown),
+            'question_breakdown': question_breakdown
+        })
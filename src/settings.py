@@ -6,6 +6,9 @@ import os
 os.environ["AWS_PROFILE"] = "cengage"
 os.environ["AWS_REGION"] = "us-east-1"
 os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+# Credentials come from the named profile, so skip the EC2 instance metadata probe
+# unless the deployment explicitly opts back in
+os.environ.setdefault("AWS_EC2_METADATA_DISABLED", "true")
 
 # Endpoints
 NeptuneEndpoint = "neptune-db://contentai-neptune-01-instance-1.crgki0ug6nab.us-east-1.neptune.amazonaws.com:8182"
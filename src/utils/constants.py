@@ -94,6 +94,10 @@ metadata_keys = {
     "topics.topic": "topic",
 }
 
+# Frozen view of the metadata keys for O(1) membership checks
+AVAILABLE_KEYS = frozenset(metadata_keys.keys())
+HAS_LO_KEY = 'learning_objectives' in AVAILABLE_KEYS
+
 content_tenant_mapping = {
     "9781305101920_p10_lores.pdf": "1305101920",
 }
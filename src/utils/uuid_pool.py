@@ -0,0 +1,40 @@
+"""
+Pooled random UUID generation for question IDs.
+"""
+import os
+import threading
+
+_POOL_SIZE = 4096
+
+# Random bytes shared by all callers, refilled from os.urandom when exhausted
+_POOL = bytearray(os.urandom(_POOL_SIZE))
+_OFFSET = 0
+_LOCK = threading.Lock()
+
+
+def _reset_pool():
+    """Give a forked child its own randomness so it never repeats the parent's IDs."""
+    global _POOL, _OFFSET, _LOCK
+    _POOL = bytearray(os.urandom(_POOL_SIZE))
+    _OFFSET = 0
+    _LOCK = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pool)
+
+
+def fast_uuid4_str() -> str:
+    """Return a random version 4 UUID string, drawing its bytes from a shared pool."""
+    global _POOL, _OFFSET
+    with _LOCK:
+        if _OFFSET + 16 > _POOL_SIZE:
+            _POOL = bytearray(os.urandom(_POOL_SIZE))
+            _OFFSET = 0
+        b = _POOL[_OFFSET:_OFFSET + 16]
+        _OFFSET += 16
+
+    b[6] = (b[6] & 0x0f) | 0x40
+    b[8] = (b[8] & 0x3f) | 0x80
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"